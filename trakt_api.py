@@ -1,7 +1,16 @@
-import json
+import re
+import time
+import ijson
+import orjson
+import functools
+import threading
 import requests
-from fuzzywuzzy import process
+from rapidfuzz import fuzz, process, utils
 from itertools import chain
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 def read_config():
@@ -12,12 +21,12 @@ def read_config():
         dict: Configuration data.
     """
     try:
-        with open('config.json', 'r') as file:
-            return json.load(file)
+        with open('config.json', 'rb') as file:
+            return orjson.loads(file.read())
     except FileNotFoundError:
         print("Error: Config file not found.")
         return None
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print("Error: Config file is not a valid JSON.")
         return None
 
@@ -30,26 +39,118 @@ REDIRECT_URI = config['redirect_uri']
 JSON_FILE_NAME = config['json_file_name']
 LIST_DATA = config['list_data']
 
+# Onscreen episode numbers look like "S01E02"; stray whitespace such as "S01 E02" is tolerated.
+_ONSCREEN_RE = re.compile(r'^\s*S(\d+)\s*E(\d+)\s*$', re.IGNORECASE)
 
-def read_json_file(filename):
+# Number of programs looked up concurrently; also sizes the connection pool below
+# so every worker thread can hold its own connection.
+MAX_WORKERS = config.get('max_workers', 10)
+
+
+class _RateLimiter:
+    """
+    Block callers so that at most `calls` requests start in any `period` seconds.
+    """
+
+    def __init__(self, calls, period):
+        self._calls = calls
+        self._period = period
+        self._starts = deque()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        # Sleeping while holding the lock makes other callers queue up behind us.
+        with self._lock:
+            now = time.monotonic()
+            while self._starts and now - self._starts[0] >= self._period:
+                self._starts.popleft()
+            if len(self._starts) >= self._calls:
+                time.sleep(self._period - (now - self._starts[0]))
+                self._starts.popleft()
+                now = time.monotonic()
+            self._starts.append(now)
+
+
+# AUTHED_API_GET_LIMIT = 1,000 calls every 5 minutes, AUTHED_API_POST_LIMIT = 1 call per second
+_GET_LIMITER = _RateLimiter(1000, 300)
+_POST_LIMITER = _RateLimiter(1, 1)
+
+
+def _wait_for_rate_limit(method):
     """
-    Read JSON data from a file.
+    Block until a request with the given HTTP method fits Trakt's rate limits.
 
     Args:
-        filename (str): Name of the JSON file.
+        method (str): HTTP method of the request.
+    """
+    limiter = _POST_LIMITER if method == "POST" else _GET_LIMITER
+    limiter.wait()
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that keeps requests within Trakt's API rate limits.
+    """
+
+    def send(self, request, **kwargs):
+        _wait_for_rate_limit(request.method)
+        return super().send(request, **kwargs)
+
+
+class _RateLimitedRetry(Retry):
+    """
+    Retry policy whose retried requests also count against Trakt's rate limits.
+
+    urllib3 re-issues retried requests inside HTTPAdapter.send, so without this
+    they would bypass the adapter's limiter.
+    """
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        _wait_for_rate_limit(self.history[-1].method if self.history else None)
+
+
+# Shared session so TCP/TLS connections to Trakt are reused across the whole run.
+# 429 responses are retried after the server's Retry-After delay.
+_SESSION = requests.Session()
+_SESSION.mount("https://", _RateLimitedAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=_RateLimitedRetry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                                  respect_retry_after_header=True)
+))
+
+
+def get_session():
+    """
+    Get the shared HTTP session used for all Trakt API calls.
 
     Returns:
-        dict: JSON data.
+        requests.Session: Shared session.
     """
-    try:
-        with open(filename, 'r') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        print(f"Error: JSON file '{filename}' not found.")
-        return None
-    except json.JSONDecodeError:
-        print(f"Error: JSON file '{filename}' is not a valid JSON.")
-        return None
+    return _SESSION
+
+
+def iter_programs(filename):
+    """
+    Stream the programs from an EPG JSON file.
+
+    Programs are parsed one at a time, so large EPG files are never fully
+    loaded into memory.
+
+    Args:
+        filename (str): Name of the JSON file.
+
+    Yields:
+        dict: Program data.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ijson.JSONError: If the file is not valid JSON, possibly after some
+            programs have already been yielded.
+    """
+    with open(filename, 'rb') as file:
+        yield from ijson.items(file, 'programs.item')
 
 
 def get_access_token(authorization_code):
@@ -71,7 +172,7 @@ def get_access_token(authorization_code):
         'grant_type': 'authorization_code'
     }
 
-    response = requests.post(token_url, json=token_data)
+    response = _SESSION.post(token_url, json=token_data)
     if response.status_code == 200:
         return response.json()['access_token']
     else:
@@ -79,6 +180,21 @@ def get_access_token(authorization_code):
         return None
 
 
+def configure_session(access_token):
+    """
+    Attach the Trakt API headers to the shared session.
+
+    Args:
+        access_token (str): Access token.
+    """
+    _SESSION.headers.update({
+        "Content-Type": "application/json",
+        "Authorization": "Bearer " + access_token,
+        "trakt-api-version": "2",
+        "trakt-api-key": CLIENT_ID
+    })
+
+
 def is_movie(program):
     """
     Check if the program is a movie.
@@ -89,37 +205,99 @@ def is_movie(program):
     Returns:
         bool: True if the program is a movie, False otherwise.
     """
-    for episode_key in ["episodeNum", "episodenum"]:
-        for episode in program.get(episode_key, []):
-            if episode.get("system") == "dd_progid":
-                value = episode.get("value", "")
-                if value[:2].lower() == "mv":
-                    return True
+    for episode in chain(program.get("episodeNum", ()), program.get("episodenum", ())):
+        if episode.get("system") == "dd_progid":
+            value = episode.get("value", "")
+            if len(value) >= 2 and value[0] in "mM" and value[1] in "vV":
+                return True
     return False
 
 
-def get_first_show_id(show_title, access_token):
+def _memoize(func):
+    """
+    Cache a function's results by its arguments.
+
+    Concurrent callers asking for the same arguments wait on the first call
+    instead of issuing a duplicate request. Failed calls are not cached.
+
+    Args:
+        func (callable): Function to cache.
+
+    Returns:
+        callable: Cached function.
+    """
+    cache = {}
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        with lock:
+            future = cache.get(args)
+            is_owner = future is None
+            if is_owner:
+                future = cache[args] = Future()
+        if is_owner:
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                with lock:
+                    del cache[args]
+                future.set_exception(e)
+        return future.result()
+
+    return wrapper
+
+
+@_memoize
+def _search_shows(title_key):
+    """
+    Search Trakt for shows matching a normalized title.
+
+    Args:
+        title_key (str): Stripped, lowercased show title.
+
+    Returns:
+        list: Show search results.
+    """
+    search_url = "https://api.trakt.tv/search/show"
+    search_params = {"query": title_key, "type": "show"}
+    response = _SESSION.get(search_url, params=search_params)
+    response.raise_for_status()
+    return response.json()
+
+
+@_memoize
+def _get_seasons_with_episodes(show_id):
+    """
+    Get the seasons of a show with their episodes embedded, in a single request.
+
+    Args:
+        show_id (int): Trakt show ID.
+
+    Returns:
+        list: Season data, each with an "episodes" list.
+    """
+    seasons_api_url = f"https://api.trakt.tv/shows/{show_id}/seasons?extended=episodes"
+    response = _SESSION.get(seasons_api_url)
+    response.raise_for_status()
+    return response.json()
+
+
+def get_first_show_id(show_title):
     """
     Get the ID of the first show matching the title.
 
     Args:
         show_title (str): Title of the show.
-        access_token (str): Access token.
 
     Returns:
         str: Show ID.
     """
-    search_url = f"https://api.trakt.tv/search/show?query={show_title}&type=show"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer " + access_token,
-        "trakt-api-version": "2",
-        "trakt-api-key": CLIENT_ID
-    }
-
-    response = requests.get(search_url, headers=headers)
-    response.raise_for_status()
-    show_data = response.json()
+    try:
+        show_data = _search_shows(show_title.strip().lower())
+    except requests.exceptions.RequestException as e:
+        print(f"Error occurred while searching for show '{show_title}': {e}")
+        return None
 
     if show_data:
         show_id = show_data[0].get("show", {}).get("ids", {}).get("trakt")
@@ -133,37 +311,39 @@ def get_first_show_id(show_title, access_token):
         return None
 
 
-def search_episode_by_onscreen_value(show_title, onscreen_value, access_token):
+def parse_onscreen_value(onscreen_value):
+    """
+    Parse an onscreen value such as "S01E02" into season and episode numbers.
+
+    Args:
+        onscreen_value (str): Onscreen value.
+
+    Returns:
+        tuple: (season_number, episode_number) if valid, None otherwise.
+    """
+    match = _ONSCREEN_RE.match(onscreen_value)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def search_episode_by_onscreen_value(show_title, show_id, season_number, episode_number):
     """
     Get Trakt episode ID using onscreen value.
 
     Args:
         show_title (str): Title of the show.
-        onscreen_value (str): Onscreen value.
-        access_token (str): Access token.
+        show_id (int): Trakt show ID.
+        season_number (int): Season number.
+        episode_number (int): Episode number.
 
     Returns:
         dict: Episode data if found, None otherwise.
     """
-    season_number = ""
-    episode_number = ""
     try:
-        season_number, episode_number = map(int, onscreen_value[1:].split('E'))
-
-        show_id = get_first_show_id(show_title, access_token)
-        if not show_id:
-            return None
-
         episode_summary_url = (f"https://api.trakt.tv/shows/{show_id}/seasons/{season_number}"
                                f"/episodes/{episode_number}?extended=full")
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer " + access_token,
-            "trakt-api-version": "2",
-            "trakt-api-key": CLIENT_ID
-        }
-
-        response = requests.get(episode_summary_url, headers=headers)
+        response = _SESSION.get(episode_summary_url)
         if response.status_code == 404:
             return None  # Episode not found
         response.raise_for_status()
@@ -174,76 +354,64 @@ def search_episode_by_onscreen_value(show_title, onscreen_value, access_token):
     except requests.exceptions.RequestException as e:
         print(f"Error occurred while fetching S{season_number}E{episode_number} data in '{show_title}': {e}")
         return None
-    except ValueError:
-        print(f"Error: Invalid onscreen value '{onscreen_value}'.")
-        return None
 
 
-def search_episode_by_title(show_title, episode_title, access_token):
+def search_episode_by_title(show_title, episode_title):
     """
     Search for a specific episode by its title.
 
     Args:
         show_title (str): Title of the show.
         episode_title (str): Title of the episode.
-        access_token (str): Access token.
 
     Returns:
         dict: Episode data if found, None otherwise.
     """
-    search_api_url = f"https://api.trakt.tv/search/show?query={show_title}&type=show"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer " + access_token,
-        "trakt-api-version": "2",
-        "trakt-api-key": CLIENT_ID
-    }
+    if not episode_title:
+        return None
+    show_title_cf = show_title.strip().casefold()
+    episode_title_cf = episode_title.strip().casefold()
     try:
-        response = requests.get(search_api_url, headers=headers)
-        response.raise_for_status()
-        shows = response.json()
+        shows = _search_shows(show_title.strip().lower())
         for show in shows:
-            if process.extractOne(show_title.lower(), [show["show"]["title"].lower()])[1] > 90:
+            title = show["show"]["title"]
+            if (title.casefold() == show_title_cf
+                    or fuzz.WRatio(show_title, title, processor=utils.default_process) > 90):
                 show_id = show["show"]["ids"]["trakt"]
-                seasons_api_url = f"https://api.trakt.tv/shows/{show_id}/seasons"
-                response = requests.get(seasons_api_url, headers=headers)
-                response.raise_for_status()
-                seasons = response.json()
-                for season in seasons:
-                    season_number = season["number"]
-                    episodes_api_url = f"https://api.trakt.tv/shows/{show_id}/seasons/{season_number}/episodes"
-                    response = requests.get(episodes_api_url, headers=headers)
-                    response.raise_for_status()
-                    episodes = response.json()
-                    for episode in episodes:
-                        if process.extractOne(episode_title.lower(), [episode["title"].lower()])[1] > 90:
-                            return episode
+                seasons = _get_seasons_with_episodes(show_id)
+                episodes = [episode for season in seasons for episode in season.get("episodes", [])]
+                # Most EPG titles match exactly, so only fall back to fuzzy scoring when none do.
+                for episode in episodes:
+                    if episode["title"] and episode["title"].casefold() == episode_title_cf:
+                        return episode
+                # Score every episode of the show in one call and keep the best match. The threshold
+                # is exclusive: WRatio scores a verbatim substring at exactly 90, and a combined
+                # "Part One; Part Two" subtitle must not match a single part.
+                match = process.extractOne(episode_title, [episode["title"] for episode in episodes],
+                                           scorer=fuzz.WRatio, processor=utils.default_process,
+                                           score_cutoff=90)
+                if match and match[1] > 90:
+                    return episodes[match[2]]
     except requests.exceptions.RequestException as e:
         print(f"Error occurred while fetching episode data for '{show_title}': {e}")
         return None
 
 
-def search_movie_by_title_and_year(movie_title, movie_year, access_token):
+def search_movie_by_title_and_year(movie_title, movie_year):
     """
     Search for a movie by its title and release year.
 
     Args:
         movie_title (str): Title of the movie.
         movie_year (str): Release year of the movie.
-        access_token (str): Access token.
 
     Returns:
         dict: Movie data if found, None otherwise.
     """
-    search_api_url = f"https://api.trakt.tv/search/movie?query={movie_title}&type=movie"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer " + access_token,
-        "trakt-api-version": "2",
-        "trakt-api-key": CLIENT_ID
-    }
+    search_api_url = "https://api.trakt.tv/search/movie"
+    search_params = {"query": movie_title, "type": "movie"}
     try:
-        response = requests.get(search_api_url, headers=headers)
+        response = _SESSION.get(search_api_url, params=search_params)
         response.raise_for_status()
         movie_data = response.json()
         if movie_data:
@@ -261,25 +429,18 @@ def search_movie_by_title_and_year(movie_title, movie_year, access_token):
         return None
 
 
-def create_trakt_list(list_data, access_token):
+def create_trakt_list(list_data):
     """
     Create a Trakt list.
 
     Args:
         list_data (dict): List data.
-        access_token (str): Access token.
 
     Returns:
         str: List ID.
     """
     create_list_url = "https://api.trakt.tv/users/{}/lists".format(USER_ID)
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer " + access_token,
-        "trakt-api-version": "2",
-        "trakt-api-key": CLIENT_ID
-    }
-    response = requests.post(create_list_url, headers=headers, json=list_data)
+    response = _SESSION.post(create_list_url, json=list_data)
     if response.status_code == 201:
         return response.json()["ids"]["trakt"]
     else:
@@ -287,7 +448,7 @@ def create_trakt_list(list_data, access_token):
         return None
 
 
-def add_to_trakt_list(list_id, movie_list, episode_list, access_token):
+def add_to_trakt_list(list_id, movie_list, episode_list):
     """
     Add episodes to a Trakt list.
 
@@ -295,23 +456,16 @@ def add_to_trakt_list(list_id, movie_list, episode_list, access_token):
         list_id (str): List ID.
         movie_list (list): List of movie data to be added.
         episode_list (list): List of episodes.
-        access_token (str): Access token.
 
     Returns:
         bool: True if successful, False otherwise.
     """
     add_items_url = "https://api.trakt.tv/users/{}/lists/{}/items".format(USER_ID, list_id)
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer " + access_token,
-        "trakt-api-version": "2",
-        "trakt-api-key": CLIENT_ID
-    }
     data = {
         "movies": movie_list,
         "episodes": episode_list
     }
-    response = requests.post(add_items_url, headers=headers, json=data)
+    response = _SESSION.post(add_items_url, data=orjson.dumps(data))
     if response.status_code == 201:
         print("shows/movies added to '{}' Trakt list".format(LIST_DATA['name']))
         return True
@@ -332,56 +486,165 @@ def get_authorization_code():
     return input("Enter the authorization code from the URL: ")
 
 
-def get_trakt_episode_data(show_title, episode_title, onscreen_value, access_token):
+def get_trakt_episode_data(show_title, show_id, episode_title, onscreen_numbers):
     """
     Get Trakt episode data.
 
     Args:
         show_title (str): Title of the show.
+        show_id (int): Trakt show ID resolved up front, None if not found.
         episode_title (str): Title of the episode.
-        onscreen_value (str): Onscreen value.
-        access_token (str): Access token.
+        onscreen_numbers (tuple): Season and episode numbers from the onscreen value.
 
     Returns:
         list: List of episode data.
     """
     episodes_list = []
-    if show_title and (episode_title or onscreen_value):
-        if onscreen_value:
-            episode = search_episode_by_onscreen_value(show_title, onscreen_value, access_token)
+    if show_title and (episode_title or onscreen_numbers):
+        if onscreen_numbers:
+            episode = None
+            if show_id:
+                episode = search_episode_by_onscreen_value(show_title, show_id, *onscreen_numbers)
             if not episode:
-                episode = search_episode_by_title(show_title, episode_title, access_token)
-                if episode:
-                    episodes_list.append({"ids": episode["ids"]})
-                else:
-                    print(f"'{onscreen_value}' in '{show_title}' not found")
+                episode = search_episode_by_title(show_title, episode_title)
+            if episode:
+                episodes_list.append({"ids": episode["ids"]})
+            else:
+                print("'S{:02d}E{:02d}' in '{}' not found".format(*onscreen_numbers, show_title))
         else:
-            episode = search_episode_by_title(show_title, episode_title, access_token)
-            if (not episode) and (';' in episode_title):
-                episode_titles = episode_title.split(';')
-                for short_episode in episode_titles:
-                    episode = search_episode_by_title(show_title, short_episode.strip(), access_token)
+            episode = search_episode_by_title(show_title, episode_title)
+            if episode:
+                episodes_list.append({"ids": episode["ids"]})
+            elif ';' in episode_title:
+                for short_episode in episode_title.split(';'):
+                    episode = search_episode_by_title(show_title, short_episode.strip())
                     if episode:
                         episodes_list.append({"ids": episode["ids"]})
                     else:
                         print(f"Failed to find Trakt ID for '{short_episode.strip()}' in '{show_title}'")
-
-        if episode:
-            episodes_list.append({"ids": episode["ids"]})
-        elif (not episode) and not (';' in episode_title):
-            print(f"Failed to find Trakt ID for '{episode_title}' in '{show_title}'")
-        return episodes_list
+            else:
+                print(f"Failed to find Trakt ID for '{episode_title}' in '{show_title}'")
     else:
         print(f"Empty subtitle or onscreen_value for program: '{show_title}'")
 
     return episodes_list
 
 
+def unique_items(items):
+    """
+    Drop repeated items from a list payload, keeping the first occurrence.
+
+    Args:
+        items (list): List of {"ids": ...} entries.
+
+    Returns:
+        list: Items with distinct IDs, in their original order.
+    """
+    seen = set()
+    result = []
+    for item in items:
+        key = frozenset(item["ids"].items())
+        if key not in seen:
+            seen.add(key)
+            result.append(item)
+    return result
+
+
+def get_program_lookup(program):
+    """
+    Extract the fields needed to look up a program on Trakt.
+
+    Args:
+        program (dict): Program data.
+
+    Returns:
+        tuple: ("movies", movie_title, movie_year) or
+            ("episodes", show_title, episode_title, onscreen_numbers).
+    """
+    if is_movie(program):
+        value = program["title"][0]["value"] if program.get("title") else None
+        movie_title = value.strip() if value else None
+        movie_year = program["date"] if program.get("date") else None
+        return "movies", movie_title, movie_year
+
+    show_title = program["title"][0]["value"] if program.get("title") else None
+    episode_title = ""
+    # Check if "subTitle" or "subtitle" exists
+    if "subTitle" in program:
+        episode_title = program.get("subTitle", [""])[0].get("value") if program.get("subTitle") else None
+    elif "subtitle" in program:
+        episode_title = program.get("subtitle", [""])[0].get("value") if program.get("subtitle") else None
+    onscreen_value = next((item.get("value") for item in program.get("episodeNum", [])
+                           if item.get("system") == "onscreen"), None)
+    # Parse once here so reruns share a lookup and resolvers get plain integers.
+    onscreen_numbers = parse_onscreen_value(onscreen_value) if onscreen_value else None
+    if onscreen_value and not onscreen_numbers:
+        print(f"Error: Invalid onscreen value '{onscreen_value}'.")
+    return "episodes", show_title, episode_title, onscreen_numbers
+
+
+def get_lookup_key(lookup):
+    """
+    Get the key under which reruns of the same program share one lookup.
+
+    Movie titles are compared case-insensitively; the lookup itself keeps the
+    original title for searching.
+
+    Args:
+        lookup (tuple): Lookup returned by get_program_lookup.
+
+    Returns:
+        tuple: Hashable key.
+    """
+    if lookup[0] == "movies":
+        _, movie_title, movie_year = lookup
+        return "movies", movie_title.lower() if movie_title else movie_title, movie_year
+    return lookup
+
+
+def resolve_lookup(lookup, show_ids):
+    """
+    Look up the Trakt IDs for a program lookup.
+
+    Args:
+        lookup (tuple): Lookup returned by get_program_lookup.
+        show_ids (dict): Trakt show IDs by show title.
+
+    Returns:
+        list: List of {"ids": ...} entries.
+    """
+    if lookup[0] == "movies":
+        _, movie_title, movie_year = lookup
+        if movie_title and movie_year:
+            movie_data = search_movie_by_title_and_year(movie_title, movie_year)
+            if movie_data:
+                return [{"ids": movie_data["ids"]}]
+        else:
+            print(f"Both movie title and year are required to search for movie data of '{movie_title}'.")
+        return []
+
+    _, show_title, episode_title, onscreen_numbers = lookup
+    return get_trakt_episode_data(show_title, show_ids.get(show_title), episode_title, onscreen_numbers)
+
+
 def main():
     """
     Main function to orchestrate the Trakt list creation and data addition process.
     """
-    json_data = read_json_file(config['json_file_name'])
+    # The whole file is read before authorizing so a bad EPG never produces a partially filled list.
+    filename = config['json_file_name']
+    try:
+        program_lookups = [get_program_lookup(program) for program in iter_programs(filename)]
+    except FileNotFoundError:
+        print(f"Error: JSON file '{filename}' not found.")
+        exit()
+    except ijson.JSONError:
+        print(f"Error: JSON file '{filename}' is not a valid JSON.")
+        exit()
+    # Reruns share a lookup key, so each distinct program is only resolved once.
+    unique_lookups = {}
+    for lookup in program_lookups:
+        unique_lookups.setdefault(get_lookup_key(lookup), lookup)
     movie_payload = []
     episodes_payload = []
     auth_code = get_authorization_code()
@@ -390,37 +653,32 @@ def main():
         if not access_token:
             print("Failed to obtain access token")
             exit()
+        configure_session(access_token)
 
-        list_id = create_trakt_list(config['list_data'], access_token)
+        list_id = create_trakt_list(config['list_data'])
         if not list_id:
             print("Failed to create Trakt list")
             exit()
-        for program in json_data.get("programs", []):
-            if is_movie(program):
-                movie_title = program["title"][0]["value"] if program.get("title") else None
-                movie_year = program["date"] if program.get("date") else None
-                if movie_title and movie_year:
-                    movie_data = search_movie_by_title_and_year(movie_title.strip(), movie_year, access_token)
-                    if movie_data:
-                        movie_payload.append({"ids": movie_data["ids"]})
-                else:
-                    print(f"Both movie title and year are required to search for movie data of '{movie_title}'.")
+
+        # Lookups are independent, so run them concurrently. Shows looked up by onscreen value
+        # are resolved to IDs first, so the episode pass only fetches episode summaries.
+        show_titles = list(dict.fromkeys(lookup[1] for lookup in unique_lookups.values()
+                                         if lookup[0] == "episodes" and lookup[1] and lookup[3]))
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            show_ids = dict(zip(show_titles, executor.map(get_first_show_id, show_titles)))
+            results = dict(zip(unique_lookups, executor.map(lambda lookup: resolve_lookup(lookup, show_ids),
+                                                            unique_lookups.values())))
+
+        # Fan the results back out in EPG order.
+        for lookup in program_lookups:
+            if lookup[0] == "movies":
+                movie_payload.extend(results[get_lookup_key(lookup)])
             else:
-                show_title = program["title"][0]["value"] if program.get("title") else None
-                episode_title = ""
-                # Check if "subTitle" or "subtitle" exists
-                if "subTitle" in program:
-                    episode_title = program.get("subTitle", [""])[0].get("value") if program.get("subTitle") else None
-                elif "subtitle" in program:
-                    episode_title = program.get("subtitle", [""])[0].get("value") if program.get("subtitle") else None
-                onscreen_value = next((item.get("value") for item in program.get("episodeNum", [])
-                                       if item.get("system") == "onscreen"), None)
-                episodes_list = get_trakt_episode_data(show_title, episode_title, onscreen_value, access_token)
-                episodes_payload.append(episodes_list)
-
-        # Flatten the episodes_payload list
-        episodes_payload = list(chain.from_iterable(episodes_payload))
-        add_to_trakt_list(list_id, movie_payload, episodes_payload, access_token)
+                episodes_payload.append(results[get_lookup_key(lookup)])
+
+        # Flatten the episodes_payload list; a Trakt list holds each item once, so drop repeats.
+        episodes_payload = unique_items(chain.from_iterable(episodes_payload))
+        add_to_trakt_list(list_id, unique_items(movie_payload), episodes_payload)
     else:
         print("Failed to obtain authorization code")
         exit()